@@ -1,21 +1,35 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-from datetime import datetime
+from datetime import date, datetime
 import argparse
-import locale
+import hashlib
+import json
 import logging
-import markdown
+import math
 import os
 import pprint
 import re
 import pprint
+import shutil
 import sys
-import threading
+import tempfile
 import toml
-from contextlib import contextmanager
-from jinja2 import Environment, FileSystemLoader
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable
+from babel import UnknownLocaleError
+from babel.dates import format_date as babel_format_date
 from slugify import UniqueSlugify
 
+# python-markdown and Jinja2 take a while to import. They are imported when
+# they are needed so that worker processes (which never render templates) and
+# runs using another Markdown engine (or just printing --help) start faster.
+if TYPE_CHECKING:
+    from jinja2 import BaseLoader, Environment, Template
+    from markdown import Markdown
+
 # Settings for this script. Should be parametrized later.
 # POSTSDIR = "blogs/cno/posts"
 # OUTPUTDIR = "blogs/cno/out"
@@ -29,16 +43,66 @@ OUTPUTDIR = "public"
 STATICDIR = "static"
 TEMPLATEDIR = "templates"
 
+# Rendered Markdown is cached in this directory (relative to the working
+# directory) so unchanged posts do not need to be converted again
+CACHEDIR = ".pylive-cache"
+
+# The manifest stores the state (mtime and size) of the source files each
+# output file has been built from. Output files whose sources did not change
+# since the last run are not written again.
+MANIFEST_FILE = os.path.join(CACHEDIR, "manifest.json")
+
+# Compiled templates are cached in this directory across runs
+TEMPLATE_CACHEDIR = os.path.join(CACHEDIR, "templates")
+
+# Templates compiled ahead of time (see --compile-templates) are stored in a
+# zip file in CACHEDIR, one per template directory
+COMPILED_TEMPLATES_PREFIX = "templates-"
+
+
+# Input formats of the date in the header/preamble of a post, i.e.
+# "01.01.23" or "01.01.2023"
+FMT_DATE_INPUT_SHORT = "%d.%m.%y"
+FMT_DATE_INPUT = "%d.%m.%Y"
+# Dates matching both formats with 1-2 digit days and months
+DATE_INPUT_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2}|\d{4})", re.ASCII)
 
 # Output format
+# Dates are formatted with babel using a CLDR pattern, i.e.
+# "Donnerstag, 3. August 2023"
+# see: https://babel.pocoo.org/en/latest/dates.html#pattern-syntax
+FMT_DATE_OUTPUT_CLDR = "EEEE, d. MMMM y"
+# Fallback (strftime) if babel does not know the language
 # the "-" in %-d will remove the leading 0 (if any)
 FMT_DATE_OUTPUT = "%A, %-d. %B %Y"
 
 
-IGNOREFILES = ["README", "TEMPLATE"]  # , "helloworld"]
-EXTENSIONS = [".md"]
+IGNOREFILES = frozenset({"README", "TEMPLATE"})  # , "helloworld"
+EXTENSIONS = frozenset({".md"})
 OUTPUT_EXTENSION = ".html"
 
+# Keys that must be present in the header/preamble of a post
+REQUIRED_KEYS = frozenset({"title", "date"})
+
+# Values of header/preamble flags (i.e. "draft: false") that unset the flag
+FALSE_VALUES = frozenset({"false", "no", "off", "0"})
+
+# Post objects are created in parallel worker processes if there are at least
+# this many post files (for fewer files starting the workers is not worth it)
+PARALLEL_MIN_POSTS = 4
+
+# Maximum number of posts handed to a worker process at once. Each worker
+# renders a batch with the same (warm) Markdown instance.
+MAX_POSTS_PER_BATCH = 32
+
+# Extensions used by python-markdown to render the posts
+# see: https://python-markdown.github.io/extensions/fenced_code_blocks/
+MARKDOWN_EXTENSIONS = ("fenced_code",)
+
+# Engines that can be used to convert Markdown to HTML
+MARKDOWN_ENGINES = ("markdown", "mistune", "cmarkgfm")
+DEFAULT_MARKDOWN_ENGINE = "markdown"
+
 
 # Set up logging
 log_formatter = logging.Formatter("%(message)s")
@@ -47,13 +111,209 @@ DEFAULT_LOGLEVEL = logging.WARNING
 log = logging.getLogger()
 log.setLevel(DEFAULT_LOGLEVEL)
 
-# Set locale to de_DE to get german output (day of week, ...)
-locale.setlocale(locale.LC_ALL, "de_DE")
+# Add a handler if none is present (once, when the module is loaded)
+if not log.handlers:
+    stdout = logging.StreamHandler()
+    stdout.setFormatter(log_formatter)
+    log.addHandler(stdout)
 
 # Define slugify
 # see: https://pypi.org/project/awesome-slugify/
 slugify = UniqueSlugify()
 
+# Characters replaced by "-" in slugs of ASCII names (see create_slug())
+SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
+def create_slug(name: str) -> str:
+    """Return a unique slug for a name, i.e. "My Post" -> "my-post".
+
+    ASCII names (the common case for file names) are slugified with a single
+    regular expression which gives the same result as awesome-slugify. Other
+    names are handed to awesome-slugify for transliteration. Both share the
+    set of slugs used so far, a duplicate slug gets a numeric suffix
+    ("my-post-1").
+
+    :param name:    Name to create the slug from
+    :type name:     str
+    :return:        Unique slug
+    :rtype:         str
+    """
+    if not name.isascii():
+        return slugify(name, to_lower=True)
+
+    # awesome-slugify drops apostrophes instead of separating words
+    slug = SLUG_SEPARATOR_RE.sub("-", name.lower().replace("'", "")).strip("-")
+    unique_slug = slug
+    count = 0
+    while unique_slug in slugify.uids:
+        count += 1
+        unique_slug = f"{slug}-{count}"
+    slugify.uids.add(unique_slug)
+    return unique_slug
+
+
+# Define the Markdown converter
+# A single instance is reused for all posts (and reset before each use)
+# instead of setting up the parser and its extensions for every post.
+# It is created on first use (see python_markdown()).
+md: Markdown | None = None
+
+
+def python_markdown(text: str) -> str:
+    """Convert Markdown text to HTML using python-markdown.
+
+    :param text:    Text in Markdown format
+    :type text:     str
+    :return:        Text converted to HTML
+    :rtype:         str
+    """
+    global md
+
+    if md is None:
+        import markdown
+
+        md = markdown.Markdown(extensions=list(MARKDOWN_EXTENSIONS))
+
+    # reset() clears the state left over from the previous document
+    return md.reset().convert(text)
+
+
+# Markdown engine used to render the posts (see set_markdown_engine())
+markdown_engine: str = DEFAULT_MARKDOWN_ENGINE
+convert_markdown: Callable[[str], str] = python_markdown
+
+
+def set_markdown_engine(engine: str) -> None:
+    """Select the engine used to convert Markdown to HTML.
+
+    "markdown" uses python-markdown with MARKDOWN_EXTENSIONS, "mistune" uses
+    mistune and "cmarkgfm" uses the C implementation of GitHub Flavored
+    Markdown (fenced code blocks are built in). Both are considerably faster
+    but do not support python-markdown's extensions. cmarkgfm is installed
+    with requirements.txt, mistune has to be installed separately.
+
+    :param engine:  Name of the Markdown engine (one of MARKDOWN_ENGINES)
+    :type engine:   str
+    """
+    global markdown_engine, convert_markdown
+
+    if engine not in MARKDOWN_ENGINES:
+        raise ValueError(f"Unknown Markdown engine: {engine}")
+
+    if engine == "cmarkgfm":
+        import cmarkgfm
+        from cmarkgfm.cmark import Options
+
+        # Keep raw HTML in posts like python-markdown does
+        convert_markdown = partial(
+            cmarkgfm.github_flavored_markdown_to_html,
+            options=Options.CMARK_OPT_UNSAFE,
+        )
+    elif engine == "mistune":
+        import mistune
+
+        mistune_markdown = mistune.create_markdown(escape=False)
+
+        # mistune's renderer may return a list (AST), HTML is always a str
+        def convert_mistune(text: str) -> str:
+            return str(mistune_markdown(text))
+
+        convert_markdown = convert_mistune
+    else:
+        convert_markdown = python_markdown
+
+    markdown_engine = engine
+    render_cached.cache_clear()
+    log.debug("Use Markdown engine %s", engine)
+
+
+def render_cache_file(text: str) -> str:
+    """Return the name of the file the HTML of a Markdown text is cached in.
+
+    The cache key is derived from the text, the Markdown engine and the
+    extensions used for rendering.
+
+    :param text:    Text in Markdown format
+    :type text:     str
+    :return:        Path of the cache file (in CACHEDIR)
+    :rtype:         str
+    """
+    raw = text.encode("utf-8")
+    settings = repr((markdown_engine, MARKDOWN_EXTENSIONS)).encode("utf-8")
+    key = hashlib.sha256(raw + settings).hexdigest()[:16]
+    return os.path.join(CACHEDIR, f"{key}.html")
+
+
+@lru_cache(maxsize=4096)
+def render_cached(text: str) -> str:
+    """Convert Markdown text to HTML and cache the result on disk.
+
+    Results are additionally memoized in-process so rendering the same text
+    again during a run is a dictionary lookup.
+
+    If a cached file exists for the text (see render_cache_file()) its
+    contents are returned, otherwise the text is rendered and the result is
+    written to CACHEDIR. The file is written under a temporary name and
+    renamed afterwards so that neither concurrent workers nor an aborted run
+    can leave a partially written file behind.
+
+    :param text:    Text in Markdown format
+    :type text:     str
+    :return:        Text converted to HTML
+    :rtype:         str
+    """
+    cached_file = render_cache_file(text)
+
+    try:
+        with open(cached_file, "rb") as f:
+            log.debug("Use cached HTML from %s", cached_file)
+            return f.read().decode("utf-8")
+    except FileNotFoundError:
+        pass
+
+    html = convert_markdown(text)
+
+    try:
+        os.makedirs(CACHEDIR, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=CACHEDIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(html.encode("utf-8"))
+            os.replace(tmp_file, cached_file)
+        except OSError:
+            os.unlink(tmp_file)
+            raise
+    except OSError as e:
+        log.warning("Could not write cache file %s: %s", cached_file, e)
+
+    return html
+
+
+@lru_cache(maxsize=256)
+def format_date(day: date, lang: str | None = None) -> str:
+    """Return the human-readable representation of a day, i.e.
+    "Donnerstag, 3. August 2023".
+
+    Results are cached per day and language. Names of days and months are
+    taken from babel's locale data so the process' locale is not touched.
+
+    :param day:     Day to format
+    :type day:      date
+    :param lang:    Language (locale) used for names of days and months
+    :type lang:     str | None
+    :return:        Human-readable date
+    :rtype:         str
+    """
+    # Strip encoding and modifier, i.e. "de_DE.UTF-8" -> "de_DE"
+    lang = (lang or DEFAULT_LOCALE).split(".")[0].split("@")[0]
+    try:
+        return babel_format_date(day, FMT_DATE_OUTPUT_CLDR, locale=lang)
+    except (UnknownLocaleError, ValueError) as e:
+        log.warning("Could not create printable date in %s: %s", lang, e)
+
+    return day.strftime(FMT_DATE_OUTPUT)
+
 
 class Post:
     """This object represents a post.
@@ -65,62 +325,84 @@ class Post:
     Each post is represented as a markdown file in the file system.
     """
 
+    # Posts only have the attributes listed here (no per-instance __dict__).
+    # All of them are initialized in __init__, the annotations below describe
+    # them.
+    __slots__ = (
+        "__filename",
+        "__next",
+        "__prev",
+        "__slug",
+        "__outfile",
+        "raw_text",
+        "__rendered_text",
+        "meta",
+        "lang",
+        "__date",
+        "__isodate",
+        "printable_date",
+        "__draft",
+        "__hidden",
+        "valid",
+    )
+
     # Source file name (Markdown file of post)
-    __filename: str = ""
+    __filename: str
 
-    # Full path of the output filename
-    # __outfile: str = ""
+    # Name of the output file (slug and OUTPUT_EXTENSION)
+    # None until the slug has been assigned (see self.outfile)
+    __outfile: str | None
 
     # Post neigbors
-    __next: Post | None = None
-    __prev: Post | None = None
+    __next: Post | None
+    __prev: Post | None
 
     # Name of the (output) file
     # Will be derived from the input filename
-    __slug: str | None = None
-
-    # Keep the contents of the file in this variable.
-    # This contains the original contents used to parse the Post object
-    raw: str = ""
+    __slug: str | None
 
     # Raw markdown text of post without header/preamble
     # (textblock surrounded by '---\n')
-    raw_text: str = ""
+    raw_text: str
 
-    # HTML code of the post as provided in the markdown file/raw variable
-    # without the header/preamble block (text surrounded by '---\n')
-    rendered_text: str = ""
+    # HTML code of the post (see self.rendered_text)
+    # None until the text has been rendered
+    __rendered_text: str | None
 
     # The meta dictionary contains all information described in the post's
     # preamble as a key-value pair.
-    meta: dict[str, str] = {}
+    meta: dict[str, str]
 
     # The following attributes will be set by self.__parse_attributes
 
     # The the post's language (locale)
     # Can be derived from the blog's default language (if not set in post)
     # or set individually using the "lang" or "language" attribute
-    lang: str = DEFAULT_LOCALE
+    lang: str
 
     # Date and time of publication
     # Must be set by "date" keyword in post's heade
-    __date: datetime | None = None
+    __date: datetime | None
+
+    # ISO 8601 representation of the date (see self.isodate)
+    # None until first used
+    __isodate: str | None
 
     # Human-readable string representing the date, i.e.
     # "Donnerstag, 3. August 2023"
-    printable_date: str = ""
+    printable_date: str
 
     # If post is a draft
     # This literally means that this script ignores this post
-    __draft: bool = False
+    __draft: bool
 
     # Post is a "hidden" post that will create a page that is not part of the
     # blog's list of posts
-    __hidden: bool = False
+    __hidden: bool
 
     # If post has a valid header section and can be published
     # Set by self.__validate_header()
-    valid: bool = True
+    valid: bool
 
     def __init__(self, full_filename: str):
         """The initialization function awaits the markdown text of this blog
@@ -130,21 +412,31 @@ class Post:
         :param full_filename:   full path to Markdown filename of post
         :type full_filename:    str
         """
-        log.info(f"Create post object from {full_filename}")
-
-        # First read the contents of the file before
-        # saving just the file's basename
-        log.info("Read file contents")
-        self.raw = self.__read_file(full_filename)
+        log.info("Create post object from %s", full_filename)
 
-        # Store the basename
+        # Store the basename and set the defaults
         self.__filename = os.path.basename(full_filename)
+        self.__next = None
+        self.__prev = None
+        self.__slug = None
+        self.__outfile = None
+        self.__rendered_text = None
+        self.meta = {}
+        self.lang = DEFAULT_LOCALE
+        self.__date = None
+        self.__isodate = None
+        self.printable_date = ""
+        self.__draft = False
+        self.__hidden = False
+        self.valid = True
+
+        # Read the contents of the file
+        # (not kept, only the header and the text are needed afterwards)
+        log.info("Read file contents")
+        raw = self.__read_file(full_filename)
 
         # Get the meta information and the raw text
-        self.meta, self.raw_text = self.__segment(self.raw)
-
-        # Render the text to HTML
-        self.rendered_text = self.__render(self.raw_text)
+        self.meta, self.raw_text = self.__segment(raw)
 
         # Set additional attributes
         self.__parse_attributes(self.meta)
@@ -163,22 +455,18 @@ class Post:
 
     @property
     def isodate(self) -> str | None:
-        if self.date:
-            return self.date.astimezone().isoformat()
-        return None
+        if self.__isodate is None and self.date:
+            self.__isodate = self.date.astimezone().isoformat()
+        return self.__isodate
 
     @property
     def basename(self) -> str:
-        return os.path.basename(self.filename)
+        # The filename is stored without its path already
+        return self.__filename
 
     @property
     def slug(self) -> str:
-        if not self.__slug:
-            self.__slug = slugify(
-                os.path.splitext(self.basename)[0],
-                to_lower=True,
-            )
-        return self.__slug
+        return self.assign_slug()
 
     @property
     def filename(self) -> str:
@@ -186,7 +474,19 @@ class Post:
 
     @property
     def outfile(self) -> str:
-        return f"{self.slug}{OUTPUT_EXTENSION}"
+        if self.__outfile is None:
+            self.__outfile = f"{self.slug}{OUTPUT_EXTENSION}"
+        return self.__outfile
+
+    @property
+    def rendered_text(self) -> str:
+        """HTML code of the post as provided in the markdown file/raw variable
+        without the header/preamble block (text surrounded by '---\n').
+
+        The text is rendered on first access so posts that are never
+        published (i.e. drafts) are not rendered at all.
+        """
+        return self.render()
 
     @property
     def html(self) -> str:
@@ -222,6 +522,29 @@ class Post:
     def has_prev(self) -> bool:
         return self.__prev is not None
 
+    def assign_slug(self) -> str:
+        """Assign a unique slug to the post unless it already has one.
+
+        Slugs are unique per process (see create_slug()), the order in which
+        posts get their slugs decides which one gets a numeric suffix.
+
+        :return:    Slug of the post
+        :rtype:     str
+        """
+        if not self.__slug:
+            self.__slug = create_slug(os.path.splitext(self.basename)[0])
+        return self.__slug
+
+    def render(self) -> str:
+        """Render the post's text into HTML unless that has been done before.
+
+        :return:    Text of post converted to HTML
+        :rtype:     str
+        """
+        if self.__rendered_text is None:
+            self.__rendered_text = self.__render(self.raw_text)
+        return self.__rendered_text
+
     def __read_file(self, full_filename: str) -> str:
         """Read the contents from the specified file.
 
@@ -230,9 +553,16 @@ class Post:
         :return:                Contents of the file
         :rtype:                 str
         """
-        log.info(f"Read {full_filename}")
-        with open(full_filename, "r") as f:
-            text = f.read()
+        log.info("Read %s", full_filename)
+        # Read the file in one go and decode it once (posts are UTF-8)
+        with open(full_filename, "rb") as f:
+            raw = f.read()
+        text = raw.decode("utf-8")
+
+        # Binary mode does not translate newlines. Normalize Windows (and old
+        # Mac) line endings like text mode would, __segment() looks for "\n".
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
         return text
 
     def __segment(self, text: str) -> tuple[dict[str, str], str]:
@@ -249,36 +579,34 @@ class Post:
         :return:        Metadata dictionary and raw markdown text
         :rtype:         (dict(str, str), str)
         """
-        # Split self.raw into segments (separated by ---)
-        pattern = r"---\s*\n"
-
-        # Remove empty segments and strip() leading and trailing whitespaces
-        segments = [s.strip() for s in re.split(pattern, text) if len(s.strip()) > 0]
-
-        log.debug(f"Regex split, {len(segments)} segments")
-        log.debug(segments)
-
-        # if log.level == logging.DEBUG:
-        #     snr = 0
-        #     for segment in segments:
-        #         snr += 1
-        #         log.debug(f"[{snr}] {segment}")
-
-        # The markdown text is contained in the last segment
-        # The meta information is contained in the second last segment
-        # We use relative positioning form the last element because we do not
-        # know if we get 2 or 3 segments: if the preable is between ---'s we
-        # get 3 segments, if only the closing --- is present we get 2 segments
-        if len(segments) < 2:
+        # The header/preamble is either surrounded by "---" lines or (if the
+        # opening "---" is missing) starts at the beginning of the file. It
+        # ends at the first line starting with "---". Everything after that
+        # line is the post's text.
+        text = text.lstrip()
+        header_start = 0
+        if text.startswith("---"):
+            # Skip the opening "---" line
+            header_start = text.find("\n") + 1 or len(text)
+
+        header_end = text.find("\n---", header_start)
+        header = ""
+        raw_text = ""
+        if header_end >= 0:
+            body_start = text.find("\n", header_end + 4)
+            header = text[header_start:header_end].strip()
+            if body_start >= 0:
+                raw_text = text[body_start + 1 :].strip()
+
+        log.debug("Header: %d, text: %d characters", len(header), len(raw_text))
+
+        if not header or not raw_text:
             msg = f"Could not find header/preamble segment in {self.filename}"
             log.error(msg)
             raise Exception(msg)
 
-        # Prse the meta information from the header/preamble
-        # meta_dict: dict[str, str] = self.__parse_header(segments[-2])
-        meta_dict: dict[str, str] = self.__parse_header(segments[0])
-        # raw_text = segments[-1]
-        raw_text = "\n".join(segments[1:]).strip()
+        # Parse the meta information from the header/preamble
+        meta_dict: dict[str, str] = self.__parse_header(header)
         return (meta_dict, raw_text)
 
     def __parse_header(self, header: str) -> dict[str, str]:
@@ -301,14 +629,20 @@ class Post:
         log.info("Parse header/preamble section")
         log.debug(header)
 
-        result: dict[str, str] = {}
-        for line in header.splitlines():
-            key, value = line.split(":", 1)
-            # Keys will be stored in lowercase
-            result[key.lower().strip()] = value.strip()
+        # Keys will be stored in lowercase, lines without ":" are skipped.
+        # Keys are interned: every post uses the same few keys, so all meta
+        # dicts share one string object per key.
+        result: dict[str, str] = {
+            sys.intern(key.lower().strip()): value.strip()
+            for key, separator, value in (
+                line.partition(":") for line in header.splitlines()
+            )
+            if separator
+        }
 
-        log.info(f"Found {len(result)} meta key(s): {list(result.keys())}")
-        log.debug(pprint.pformat(result))
+        log.info("Found %d meta key(s): %s", len(result), list(result))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(pprint.pformat(result))
 
         # Validate header
         if not self.__validate_header(result):
@@ -324,123 +658,116 @@ class Post:
     def __validate_header(
         self,
         header: dict[str, str],
-        required_keys: list[str] = [
-            "title",
-            "date",
-        ],
+        required_keys: frozenset[str] = REQUIRED_KEYS,
     ) -> bool:
         """Validate header/preamble information.
 
         :param header:          Dict containing header/preamble data
         :type header:           dict[str, str]
         :param required_keys:   Keys that must be contained in header dict
-        :type required_keys:    list[str]
+        :type required_keys:    frozenset[str]
         :param valid_if_draft:  Skip header verification if key "draft" exists
         :type valid_if_draft:   bool
         :return:                Whether or not header is valid
         :rtype:                 bool
         """
-        log.info(f"Validate header of {self}")
+        log.info("Validate header of %s", self)
 
-        missing_keys = set(required_keys) - set(header.keys())
-        if len(missing_keys) > 0:
-            log.error(f"Invalid header! Missing keys: {missing_keys}")
-            self.valid = False
+        missing_keys = required_keys.difference(header)
+        if missing_keys:
+            log.error("Invalid header! Missing keys: %s", missing_keys)
 
         # Check if date is in a known format that can be parsed
-        if "date" in header.keys():
+        # (the parsed date is kept, there is no need to parse it again)
+        if "date" in header:
             self.__date = self.__parse_date(header["date"])
-            if not self.date:
-                self.valid = False
 
-        return True
+        return not missing_keys and self.__date is not None
 
     def __parse_attributes(self, meta: dict[str, str]):
         """ """
         log.info("Parse attributes from post header/preamble")
         # language
         for lang_key in ["lang", "language"]:
-            if lang_key in meta.keys():
+            if lang_key in meta:
                 self.lang = meta[lang_key].strip()
-                log.info(f"Set language to {self.lang}")
+                log.info("Set language to %s", self.lang)
                 break
 
-        # date
-        self.__date == self.__parse_date(meta["date"])
+        # date (already parsed by self.__validate_header())
         if self.__date:
             self.printable_date = self.__create_printable_date(self.date, self.lang)
 
         # draft
-        # TODO: Better evaluate "draft: true"
-        self.__draft = "draft" in meta.keys()
+        self.__draft = self.__parse_flag(meta, "draft")
         if self.__draft:
             log.debug("Mark as draft")
 
         # hidden
-        # TODO: Better evaluate "hidden: true"
-        self.__hidden = "hidden" in meta.keys()
+        self.__hidden = self.__parse_flag(meta, "hidden")
         if self.__hidden:
             log.debug("Mark as hidden")
 
-    def __parse_date(self, prefix_date: str) -> datetime | None:
-        """ """
-        log.debug(f"Create printable date from {prefix_date}")
+    def __parse_flag(self, meta: dict[str, str], key: str) -> bool:
+        """Evaluate a boolean header/preamble entry such as "draft: true".
 
-        # Supported input formats
-        supported_formats: list[str] = [
-            "%d.%m.%y",  # 01.01.23
-            "%d.%m.%Y",  # 01.01.2023
-        ]
+        A flag is set if the key is present, unless its value is one of
+        FALSE_VALUES (i.e. "draft: false"). A key without value ("draft:")
+        sets the flag.
 
-        dt: datetime | None = None
+        :param meta:    Key-value-pairs of header/preample entries
+        :type meta:     dict[str, str]
+        :param key:     Key of the flag
+        :type key:      str
+        :return:        Whether or not the flag is set
+        :rtype:         bool
+        """
+        if key not in meta:
+            return False
+        return meta[key].strip("\"'").lower() not in FALSE_VALUES
 
-        for fmt in supported_formats:
-            try:
-                dt = datetime.strptime(prefix_date, fmt)
-            except Exception:
-                continue
-            # except Exception as e:
-            # log.warning(f"Could not parse {fmt}: {e}")
+    def __parse_date(self, prefix_date: str) -> datetime | None:
+        """ """
+        log.debug("Create printable date from %s", prefix_date)
 
-            break
+        # Supported input formats are FMT_DATE_INPUT_SHORT (01.01.23) and
+        # FMT_DATE_INPUT (01.01.2023). Dates of this shape are converted
+        # directly (strptime() is comparatively slow), anything else is left
+        # to strptime() using the format matching the length of the year.
+        dt: datetime | None = None
+        try:
+            match = DATE_INPUT_RE.fullmatch(prefix_date)
+            if match:
+                day, month, year = match.groups()
+                y = int(year)
+                if len(year) == 2:
+                    # Same pivot as strptime's %y: 69-99 -> 1900s, else 2000s
+                    y += 1900 if y >= 69 else 2000
+                dt = datetime(y, int(month), int(day))
+            elif len(prefix_date.rpartition(".")[2]) == 2:
+                dt = datetime.strptime(prefix_date, FMT_DATE_INPUT_SHORT)
+            else:
+                dt = datetime.strptime(prefix_date, FMT_DATE_INPUT)
+        except ValueError:
+            pass
 
         if dt:
-            log.info(f"Parsed date: {dt}")
+            log.info("Parsed date: %s", dt)
             return dt
         else:
-            log.error(f"Invalid date format: {prefix_date}")
+            log.error("Invalid date format: %s", prefix_date)
 
         return None
 
-    LOCALE_LOCK = threading.Lock()
-
-    @contextmanager
-    def setlocale(self, name):
-        with self.LOCALE_LOCK:
-            saved = locale.setlocale(locale.LC_ALL)
-            try:
-                yield locale.setlocale(locale.LC_ALL, name)
-            finally:
-                locale.setlocale(locale.LC_ALL, saved)
-
     def __create_printable_date(
         self, date: datetime | None, locale: str | None = None
     ) -> str:
         """ """
         result: str = ""
-        if locale:
-            try:
-                with self.setlocale(locale):
-                    if date:
-                        result = date.strftime(FMT_DATE_OUTPUT)
-            except Exception as e:
-                log.warning(f"Could not create printable date in {self.lang}: " f"{e}")
+        if date:
+            result = format_date(date.date(), locale)
 
-        if not result:
-            if date:
-                result = date.strftime(FMT_DATE_OUTPUT)
-
-        log.info(f"Created from {date}: {result}")
+        log.info("Created from %s: %s", date, result)
         return result
 
     def __render(self, text: str) -> str:
@@ -455,15 +782,8 @@ class Post:
         log.info("Convert Markdown to html")
         # log.debug(text)
 
-        # Use fenced_code extension
-        # see: https://python-markdown.github.io/extensions/fenced_code_blocks/
-        html = markdown.markdown(
-            text,
-            extensions=[
-                "fenced_code",
-                # 'codehilite',
-            ],
-        )
+        # Use fenced_code extension (see MARKDOWN_EXTENSIONS)
+        html = render_cached(text)
         # log.debug(html)
         return html
 
@@ -521,30 +841,34 @@ class PyLive:
     # Path where the posts (in Markdown format) are stored
     posts_directory: str = ""
 
-    ignore_filenames: list[str] = IGNOREFILES
-    post_extensions: list[str] = EXTENSIONS
+    ignore_filenames: frozenset[str] = IGNOREFILES
+    post_extensions: frozenset[str] = EXTENSIONS
 
     # Contents of the configuration file
     config: dict = {}
 
+    # Build state of the output files from the last run (see MANIFEST_FILE)
+    # Set per instance in __init__()
+    manifest: dict[str, list]
+
     # directories (initialize with default values)
     contentdir: str = CONTENTDIR
     outputdir: str = OUTPUTDIR
     staticdir: str = STATICDIR
     templatedir: str = TEMPLATEDIR
 
+    # Jinja2 environment used to load templates (see get_template())
+    environment: Environment | None = None
+
+    # State of the files in the template directory (see template_sources())
+    template_state: list[list] | None = None
+
     def __init__(self):
         """Initialize pylive.
 
         This function sets the variables needed to run script.
         """
-        # Initialize the logging facility and add a handler if none is present
-        global log
-        if len(log.handlers) == 0:
-            stdout = logging.StreamHandler()
-            stdout.setFormatter(log_formatter)
-            log.addHandler(stdout)
-            log.setLevel(DEFAULT_LOGLEVEL)
+        self.manifest = {}
 
         # if not os.path.isdir(POSTSDIR):
         #     log.error(f"{POSTSDIR} is not a directory!")
@@ -593,6 +917,34 @@ class PyLive:
             default="pylive.rc",
         )
 
+        parser.add_argument(
+            "--engine",
+            help=f"""Markdown engine used to render the posts. Overrides
+            \"engine\" in the [markdown] section of the config file, which
+            defaults to {DEFAULT_MARKDOWN_ENGINE}""",
+            choices=MARKDOWN_ENGINES,
+            # No default here (and none shown in the help), the config file
+            # decides if the option is not given
+            default=argparse.SUPPRESS,
+        )
+
+        parser.add_argument(
+            "--compile-templates",
+            help="""Compile the templates to Python modules before building
+            (they are used until a template changes)""",
+            action="store_true",
+            default=False,
+        )
+
+        parser.add_argument(
+            "--clean-cache",
+            help=f"""Remove all build caches in {CACHEDIR} before building
+            (rendered posts, manifest and compiled templates), so that
+            everything is rebuilt""",
+            action="store_true",
+            default=False,
+        )
+
         try:
             results = parser.parse_args(sys.argv[1:])
         except Exception as e:
@@ -614,11 +966,35 @@ class PyLive:
             verbosity: int = DEFAULT_LOGLEVEL - (results.verbose * 10)
             loglevel: int = max(verbosity, 10)
             log.setLevel(loglevel)
-            log.debug(f"Set log level to {loglevel}")
+            log.debug("Set log level to %s", loglevel)
+
+        # Remove all caches, the next build is a full rebuild
+        if results.clean_cache:
+            log.info("Remove cache directory %s", CACHEDIR)
+            shutil.rmtree(CACHEDIR, ignore_errors=True)
 
         # read config file
         self.config = self.read_config_file(results.config)
 
+        # Select Markdown engine (command line, config file or default)
+        engine: str | None = getattr(results, "engine", None)
+        if not engine:
+            engine = self.config.get("markdown", {}).get(
+                "engine", DEFAULT_MARKDOWN_ENGINE
+            )
+        try:
+            set_markdown_engine(engine)
+        except ValueError as e:
+            log.critical(e)
+            sys.exit(1)
+        except ImportError as e:
+            log.critical("Markdown engine %s not available: %s", engine, e)
+            sys.exit(1)
+
+        # Compile templates ahead of time
+        if results.compile_templates:
+            self.compile_templates()
+
     def read_config_file(
         self,
         filename: str,
@@ -630,16 +1006,17 @@ class PyLive:
         :return:            Configuration settings
         :rtype:             dict
         """
-        log.debug(f"Load config file {filename}")
+        log.debug("Load config file %s", filename)
 
         try:
             with open(filename, "r") as f:
                 self.config = toml.load(f)
 
-            log.debug(f"Configuration:\n{pprint.pformat(self.config)}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Configuration:\n%s", pprint.pformat(self.config))
 
         except Exception as e:
-            log.critical(f"Could not read config file: {e}")
+            log.critical("Could not read config file: %s", e)
             sys.exit(2)
 
         log.debug("Parse configuration file")
@@ -648,14 +1025,18 @@ class PyLive:
         self.staticdir = self.config.get("dirs", {}).get("static", STATICDIR)
         self.templatedir = self.config.get("dirs", {}).get("templates", TEMPLATEDIR)
 
+        # The template directory might have changed
+        self.environment = None
+        self.template_state = None
+
         # Return self.config dictionary
         return self.config
 
     def list_post_files_to_compile(
         self,
         path: str,
-        extensions: list[str] = [".md", ".markdown"],
-        ignore: list[str] = ["README", "TEMPLATE"],
+        extensions: frozenset[str] = frozenset({".md", ".markdown"}),
+        ignore: frozenset[str] = frozenset({"README", "TEMPLATE"}),
     ) -> list[str]:
         """Return the list of post names to be compiled.
 
@@ -675,48 +1056,189 @@ class PyLive:
 
         :param path:        Path where blog posts to compile are stored
         :type path:         str
-        :param extensions:  List of valid extenions of the files to be returned
-        :type extensions:   list[str]
-        :param ignore:      List of file names to ignore (without extension)
-        :type ignore:       list[str]
+        :param extensions:  Set of valid extenions of the files to be returned
+        :type extensions:   frozenset[str]
+        :param ignore:      Set of file names to ignore (without extension)
+        :type ignore:       frozenset[str]
         :return:            List of file names to be compiled
         :rtype:             list[str]
         """
-        log.info(f'Search for post files in "{path}"')
-        log.debug(f"Valid file extensions: {extensions}")
-        log.debug(f"Filenames to ignore: {ignore}")
-        files = [
-            f
-            for f in os.listdir(path)
-            if os.path.isfile(os.path.join(path, f))
-            and os.path.splitext(f)[1] in extensions
-            and os.path.splitext(f)[0] not in ignore
-        ]
-        log.info(f"{len(files)} post files found: {files}")
+        log.info('Search for post files in "%s"', path)
+        log.debug("Valid file extensions: %s", extensions)
+        log.debug("Filenames to ignore: %s", ignore)
+        # os.scandir() provides the file type from the directory listing so
+        # no additional stat() call is needed per file
+        files: list[str] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name, extension = os.path.splitext(entry.name)
+                if extension in extensions and name not in ignore:
+                    files.append(entry.name)
+        log.info("%d post files found: %s", len(files), files)
         return files
 
-    def create_post_object(self, path: str, filename: str) -> Post | None:
+    def compiled_templates_file(self) -> str:
+        """Return the file name of the compiled templates of the template
+        directory.
+
+        :return:    Path of the zip file holding the compiled templates
+        :rtype:     str
+        """
+        key = hashlib.sha1(os.path.abspath(self.templatedir).encode("utf-8"))
+        return os.path.join(
+            CACHEDIR, f"{COMPILED_TEMPLATES_PREFIX}{key.hexdigest()[:16]}.zip"
+        )
+
+    def compile_templates(self) -> None:
+        """Compile all templates of the template directory to Python modules
+        and store them in a zip file (see compiled_templates_file()).
+
+        Loading the compiled templates only imports the modules, the templates
+        neither need to be parsed nor compiled again.
+        """
+        from jinja2 import Environment, FileSystemLoader
+
+        target = self.compiled_templates_file()
+        log.info("Compile templates in %s to %s", self.templatedir, target)
+        try:
+            os.makedirs(CACHEDIR, exist_ok=True)
+            environment = Environment(loader=FileSystemLoader(self.templatedir))
+            environment.compile_templates(target, zip="deflated")
+        except Exception as e:
+            log.error("Could not compile templates: %s", e)
+
+        # The environment has to pick up the compiled templates
+        self.environment = None
+
+    def template_loader(self) -> BaseLoader:
+        """Return the loader for the templates.
+
+        Compiled templates are used if they exist and are newer than every
+        file in the template directory. Otherwise (and for templates that are
+        missing from the compiled ones) the templates are loaded from the
+        template directory.
+
+        :return:    Loader for the templates
+        :rtype:     BaseLoader
+        """
+        from jinja2 import ChoiceLoader, FileSystemLoader, ModuleLoader
+
+        loader = FileSystemLoader(self.templatedir)
+        compiled = self.compiled_templates_file()
+        try:
+            compiled_mtime = os.stat(compiled).st_mtime_ns
+        except OSError:
+            return loader
+
+        if any(mtime > compiled_mtime for _, mtime, _ in self.template_sources()):
+            log.info("Compiled templates in %s are outdated", compiled)
+            return loader
+
+        log.debug("Use compiled templates from %s", compiled)
+        return ChoiceLoader([ModuleLoader(compiled), loader])
+
+    def get_template(self, template_file: str) -> Template:
+        """Return a template from the template directory.
+
+        The Jinja2 environment is created on first use and reused afterwards.
+        It keeps every compiled template so each template is only compiled
+        once per run. Templates are not checked for changes during a run.
+
+        The bytecode of compiled templates is also stored in TEMPLATE_CACHEDIR
+        so later runs do not need to compile unchanged templates again (Jinja2
+        compares the checksum of the template source). Templates compiled
+        ahead of time are preferred (see template_loader()).
+
+        :param template_file:   Template file to load
+        :type template_file:    str
+        :return:                Compiled template
+        :rtype:                 Template
+        """
+        if self.environment is None:
+            from jinja2 import Environment, FileSystemBytecodeCache
+
+            log.debug("Create Jinja2 environment for %s", self.templatedir)
+            bytecode_cache: FileSystemBytecodeCache | None = None
+            try:
+                os.makedirs(TEMPLATE_CACHEDIR, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHEDIR)
+            except OSError as e:
+                log.warning("Could not create template cache: %s", e)
+
+            self.environment = Environment(
+                loader=self.template_loader(),
+                auto_reload=False,
+                cache_size=-1,
+                bytecode_cache=bytecode_cache,
+            )
+        return self.environment.get_template(template_file)
+
+    @staticmethod
+    def create_post_object(
+        path: str, filename: str, render: bool = True
+    ) -> Post | None:
         """Create a Post object for a particular post.
 
         :param path:        Path where blog posts to compile are stored
         :type path:         str
         :param filename:    Name of the file to render
         :type filename:     str
+        :param render:      Render the post right away (otherwise it is
+                            rendered when its HTML is needed)
+        :type render:       bool
         :return:            Object representing the post
         :rtype:             Post | None
         """
         full_filename = os.path.join(path, filename)
         try:
             post = Post(full_filename)
+            # Render posts that will be published right away (this function
+            # runs in the worker processes of create_blogchain())
+            if render and not post.draft:
+                post.render()
             return post
         except Exception as e:
-            log.error(f"Could not create Post: {e}")
+            log.error("Could not create Post: %s", e)
+
+    def unchanged_post_files(self, path: str, filenames: list[str]) -> set[str]:
+        """Return the post files that did not change since the last run.
+
+        A post file is unchanged if its modification time and size are the
+        same as recorded in the manifest of the last run (see build_key()).
+        Only entries built with the current Markdown engine count, after
+        switching engines every post has to be rendered again.
+
+        :param path:        Path where blog posts to compile are stored
+        :type path:         str
+        :param filenames:   Names of the post files
+        :type filenames:    list[str]
+        :return:            Names of the unchanged post files
+        :rtype:             set[str]
+        """
+        # A build key starts with the engine, followed by the post's own file
+        known_sources = {
+            tuple(key[1])
+            for key in self.manifest.values()
+            if len(key) > 1 and key[0] == markdown_engine and key[1]
+        }
+        unchanged: set[str] = set()
+        for filename in filenames:
+            source = os.path.join(path, filename)
+            try:
+                st = os.stat(source)
+            except OSError:
+                continue
+            if (source, st.st_mtime_ns, st.st_size) in known_sources:
+                unchanged.add(filename)
+        return unchanged
 
     def create_blogchain(
         self,
         path: str,
-        extensions: list[str],
-        ignore_files: list[str],
+        extensions: frozenset[str],
+        ignore_files: frozenset[str],
     ) -> list[Post]:
         """Return list of post objects to be published sorted by the posts'
         publication date from newest to oldest (newest post is the first
@@ -727,10 +1249,10 @@ class PyLive:
         :param path:            File system path where the markdown files are
                                 located
         :type path:             str
-        :param extenstions:     List of extensions the markdown files can have
-        :type extensions:       list[str]
-        :param ignore_files:    List of files' (basenames) to ignore
-        :type ignore_files:     list[str]
+        :param extenstions:     Set of extensions the markdown files can have
+        :type extensions:       frozenset[str]
+        :param ignore_files:    Set of files' (basenames) to ignore
+        :type ignore_files:     frozenset[str]
         :return:                List of Post Objects, the newest post first
         :rtype:                 list[Post]
         """
@@ -738,8 +1260,10 @@ class PyLive:
         list_of_post_objects: list[Post] = []
 
         log.debug(
-            f"Scan {path} for files with extensions {extensions}, "
-            f"ignoring {ignore_files}"
+            "Scan %s for files with extensions %s, ignoring %s",
+            path,
+            extensions,
+            ignore_files,
         )
         post_files_to_compile = self.list_post_files_to_compile(
             path=path,
@@ -747,60 +1271,102 @@ class PyLive:
             ignore=ignore_files,
         )
 
-        for post_file in post_files_to_compile:
-            post = self.create_post_object(path=self.contentdir, filename=post_file)
-
+        # Posts that did not change since the last run are not rendered right
+        # away. Their output files are most likely up-to-date, if not (e.g.
+        # because a neighbor changed) they are rendered when needed.
+        unchanged = self.unchanged_post_files(path, post_files_to_compile)
+        render = [post_file not in unchanged for post_file in post_files_to_compile]
+        log.debug("%d post files unchanged since last run", len(unchanged))
+
+        # Reading and rendering the posts is independent for every post so
+        # the Post objects can be created in parallel
+        posts: list[Post | None] | None = None
+        num_posts = len(post_files_to_compile)
+        if num_posts >= PARALLEL_MIN_POSTS:
+            # Spread the posts evenly over the workers in batches of at most
+            # MAX_POSTS_PER_BATCH posts. Every worker process runs the
+            # initializer, so do not start more workers than there are batches.
+            workers = os.cpu_count() or 1
+            batch_size = max(1, min(MAX_POSTS_PER_BATCH, num_posts // workers))
+            workers = min(workers, math.ceil(num_posts / batch_size))
+            log.debug(
+                "Create %d post objects in %d worker processes (batches of %d)",
+                num_posts,
+                workers,
+                batch_size,
+            )
+            try:
+                # Workers started with "spawn" (the default on macOS) import
+                # this module anew, so hand over the selected Markdown engine
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=set_markdown_engine,
+                    initargs=(markdown_engine,),
+                ) as executor:
+                    posts = list(
+                        executor.map(
+                            self.create_post_object,
+                            repeat(path),
+                            post_files_to_compile,
+                            render,
+                            chunksize=batch_size,
+                        )
+                    )
+            except (OSError, NotImplementedError) as e:
+                # i.e. no /dev/shm or no semaphores in a sandbox
+                log.warning(
+                    "Could not start worker processes, create post objects "
+                    "serially: %s",
+                    e,
+                )
+
+        if posts is None:
+            posts = [
+                self.create_post_object(
+                    path=path, filename=post_file, render=render_post
+                )
+                for post_file, render_post in zip(post_files_to_compile, render)
+            ]
+
+        for post in posts:
             # Ignore post objects that are None or marked as draft
             # (when an error has occurred during Post object creation, e.g.
             #  because of missing header/preamble)
             if post and not post.draft:
-                log.debug(f"Add {post} to list of posts to compile")
+                log.debug("Add %s to list of posts to compile", post)
                 list_of_post_objects.append(post)
 
-        log.warning(f"{len(list_of_post_objects)} post objects created")
+        log.warning("%d post objects created", len(list_of_post_objects))
 
         log.debug("Sort list of posts to publish by date")
-        # Sorted list uses the Post's built-in comparison functions.
-        # You could also achieve the same by using "key=lambda p: p.date"
-        list_of_post_objects = sorted(list_of_post_objects, reverse=True)
+        # Sort in place by the posts' dates (every valid post has a date).
+        # The key is evaluated once per post instead of calling the Post's
+        # comparison functions for every comparison.
+        list_of_post_objects.sort(key=attrgetter("date"), reverse=True)
+
+        # Assign the slugs here (in this process and in the order of the
+        # chain) so that UniqueSlugify's de-duplication always yields the same
+        # slug for the same post. Each slug is computed once and kept by the
+        # Post object.
+        for post in list_of_post_objects:
+            slug = post.assign_slug()
+            log.debug("Slug of %s: %s", post.filename, slug)
 
         # Build the chain of non-hidden posts
         log.debug(
-            f"Chain-link non-hidden posts ({len(list_of_post_objects)}" f" total posts)"
+            "Chain-link non-hidden posts (%d total posts)", len(list_of_post_objects)
         )
 
-        # Keep track of post objects when building the chain
-        next_post: Post | None = None
-        last_unhidden_post: Post | None = None
-
-        # Iterate the list of posts
-        for i in range(0, len(list_of_post_objects)):
-            # Get post object
-            post = list_of_post_objects[i]
-
-            # Get the successor of this post object (if any)
-            if (i + 1) < len(list_of_post_objects):
-                next_post = list_of_post_objects[i + 1]
-            else:
-                next_post = None
-
-            # If this post is hidden the last non-hidden post needs to point
-            # to this post's successor (and if the successor is also hidden
-            # the .next reference of the last unhidden post will be modified
-            # again)
-            if post.hidden:
-                if last_unhidden_post is not None:
-                    last_unhidden_post.next = next_post
-                continue
+        # Hidden posts are not part of the chain: every non-hidden post is
+        # linked to its non-hidden predecessor and successor (if any)
+        chain = [post for post in list_of_post_objects if not post.hidden]
+        predecessors: list[Post | None] = [None, *chain[:-1]]
+        successors: list[Post | None] = [*chain[1:], None]
 
-            # If not hidden set the references according to the settings we
-            # have
-            post.prev = last_unhidden_post
+        for prev_post, post, next_post in zip(predecessors, chain, successors):
+            post.prev = prev_post
             post.next = next_post
 
-            # ... and set this post object as last unhidden post object
-            last_unhidden_post = post
-
         return list_of_post_objects
 
     def create_html(
@@ -818,7 +1384,7 @@ class PyLive:
         :return:                Content of HTML file based on template file
         :rtype:                 str
         """
-        log.info(f"Create HTML for {post} from {template_file}")
+        log.info("Create HTML for %s from %s", post, template_file)
 
         log.debug("Create data dictionary")
         data: dict[str, str | Post | None] = {
@@ -830,9 +1396,8 @@ class PyLive:
             "prev": post.prev,
         }
 
-        log.debug("Create Jinja2 environment and load template")
-        environment = Environment(loader=FileSystemLoader(self.templatedir))
-        template = environment.get_template(template_file)
+        log.debug("Load template")
+        template = self.get_template(template_file)
 
         log.debug("Render content")
         content = template.render(data)
@@ -844,11 +1409,10 @@ class PyLive:
     ) -> str:
         """Create Atom Feed."""
         if self.config.get("feed", {}).get("enabled", "true").lower() == "false":
-            log.info(f"Creation of atom feed disabled in config file")
+            log.info("Creation of atom feed disabled in config file")
             return ""
 
-        environment = Environment(loader=FileSystemLoader(self.templatedir))
-        template = environment.get_template(
+        template = self.get_template(
             self.config.get("templates", {}).get("feed", "feed.xml")
         )
 
@@ -900,40 +1464,214 @@ class PyLive:
 
         return content
 
+    def write_file(self, filename: str, contents: str | bytes) -> None:
+        """Write an output file.
+
+        The contents are encoded to UTF-8 once (unless they already are) and
+        handed to a single write() call on a binary file, skipping
+        the text layer's chunked encoding.
+
+        :param filename:    Full path of the file to write
+        :type filename:     str
+        :param contents:    Contents of the file (str or UTF-8 encoded)
+        :type contents:     str | bytes
+        """
+        log.debug("Write %s", filename)
+        data = contents.encode("utf-8") if isinstance(contents, str) else contents
+        with open(filename, "wb") as f:
+            f.write(data)
+
+    def read_manifest(self, filename: str = MANIFEST_FILE) -> dict[str, list]:
+        """Read the manifest written by the last run.
+
+        :param filename:    Manifest file to load
+        :type filename:     str
+        :return:            Build key of each output file of the last run
+        :rtype:             dict[str, list]
+        """
+        try:
+            with open(filename, "r") as f:
+                manifest = json.load(f)
+            log.debug("Loaded manifest with %d entries", len(manifest))
+            return manifest
+        except (OSError, ValueError) as e:
+            log.info("Could not read manifest %s: %s", filename, e)
+        return {}
+
+    def write_manifest(
+        self, manifest: dict[str, list], filename: str = MANIFEST_FILE
+    ) -> None:
+        """Write the manifest for the next run.
+
+        :param manifest:    Build key of each output file
+        :type manifest:     dict[str, list]
+        :param filename:    Manifest file to write
+        :type filename:     str
+        """
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, "w") as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            log.warning("Could not write manifest %s: %s", filename, e)
+
+    def sweep_render_cache(self, blogchain: list[Post]) -> None:
+        """Remove cached HTML that does not belong to any post anymore.
+
+        Every change of a post (or of the Markdown engine) creates a new
+        cache file, the files of deleted or changed posts are removed here so
+        the cache does not grow without bounds.
+
+        :param blogchain:   Posts of this run
+        :type blogchain:    list[Post]
+        """
+        in_use = {
+            os.path.basename(render_cache_file(post.raw_text)) for post in blogchain
+        }
+        try:
+            with os.scandir(CACHEDIR) as entries:
+                stale = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_file()
+                    and entry.name.endswith(".html")
+                    and entry.name not in in_use
+                ]
+        except OSError:
+            return
+
+        log.debug("Remove %d stale file(s) from %s", len(stale), CACHEDIR)
+        for filename in stale:
+            try:
+                os.remove(filename)
+            except OSError as e:
+                log.warning("Could not remove %s: %s", filename, e)
+
+    def template_sources(self) -> list[list]:
+        """Return name, modification time and size of every file in the
+        template directory.
+
+        The directory is walked once, later calls return the same list (it
+        is reset when the config file is read).
+
+        :return:    [name, mtime_ns, size] of each template file
+        :rtype:     list[list]
+        """
+        if self.template_state is None:
+            state: list[list] = []
+            for dirpath, _, filenames in os.walk(self.templatedir):
+                for filename in filenames:
+                    source = os.path.join(dirpath, filename)
+                    try:
+                        st = os.stat(source)
+                    except OSError:
+                        continue
+                    state.append([source, st.st_mtime_ns, st.st_size])
+            state.sort()
+            self.template_state = state
+        return self.template_state
+
+    def build_key(self, post: Post, template_file: str) -> list:
+        """Return the key describing the inputs of a post's output file.
+
+        The output of a post does not only depend on its own source file but
+        also on its neighbors in the chain (their titles and links are part
+        of the page), on the templates, on the Markdown engine and on this
+        script itself. The key consists of the engine's name, the template's
+        name and the name, modification time and size of each of these files.
+        Every file in the template directory is part of the key because the
+        template may extend or include any of them.
+
+        :param post:            Post to create the key for
+        :type post:             Post
+        :param template_file:   Template file used for creating HTML
+        :type template_file:    str
+        :return:                Build key of the post's output file
+        :rtype:                 list
+        """
+        key: list = [markdown_engine]
+        sources = [
+            os.path.join(self.contentdir, p.filename) if p else None
+            for p in (post, post.prev, post.next)
+        ]
+        sources.append(os.path.abspath(__file__))
+        for source in sources:
+            if source is None:
+                key.append(None)
+                continue
+            try:
+                st = os.stat(source)
+            except OSError:
+                key.append([source])
+                continue
+            key.append([source, st.st_mtime_ns, st.st_size])
+        key.append(template_file)
+        key.append(self.template_sources())
+        return key
+
     def main(self) -> None:
         """This is the main function that coordinates the run and writes the
         files to disk.
         """
+        self.manifest = self.read_manifest()
+
         blogchain = self.create_blogchain(
             path=self.contentdir,
             extensions=self.post_extensions,
             ignore_files=self.ignore_filenames,
         )
 
-        log.warning(pprint.pformat(blogchain))
+        # Formatting the blogchain is expensive, only do so if the message
+        # will actually be emitted
+        if log.isEnabledFor(logging.WARNING):
+            log.warning(pprint.pformat(blogchain))
+
+        if log.isEnabledFor(logging.INFO):
+            log.info("Generated blogchain: %s", blogchain)
 
-        log.info(f"Generated blogchain: {blogchain}")
+        manifest: dict[str, list] = {}
 
         index_written: bool = False
         for post in blogchain:
-            log.info(pprint.pformat(post.to_dict()))
+            if log.isEnabledFor(logging.INFO):
+                log.info(pprint.pformat(post.to_dict()))
+
+            # Skip posts whose output file is up-to-date. The post that is
+            # written to index.html is always created.
+            outfile = post.outfile
+            outpath = os.path.join(OUTPUTDIR, outfile)
+            key = self.build_key(post, "index.html")
+            manifest[outfile] = key
+            if (
+                (index_written or post.hidden)
+                and self.manifest.get(outfile) == key
+                and os.path.isfile(outpath)
+            ):
+                log.info("%s is up-to-date", outfile)
+                continue
 
-            html_contents = self.create_html(post=post, template_file="index.html")
+            # Encode once, the same bytes may also be written to index.html
+            html_contents = self.create_html(
+                post=post, template_file="index.html"
+            ).encode("utf-8")
 
-            with open(os.path.join(OUTPUTDIR, post.outfile), "w") as f:
-                f.write(html_contents)
+            self.write_file(outpath, html_contents)
 
             # Write index.html: First non-hidden page in chain
             if not index_written and not post.hidden:
-                with open(os.path.join(OUTPUTDIR, "index.html"), "w") as f:
-                    f.write(html_contents)
+                self.write_file(os.path.join(OUTPUTDIR, "index.html"), html_contents)
                 index_written = True
 
         # Create Feed
         if self.config.get("feed", {}).get("enabled", "false").lower() == "true":
             feed_filename: str = self.config.get("feed", {}).get("file", "index.xml")
-            with open(os.path.join(OUTPUTDIR, feed_filename), "w") as f:
-                f.write(self.create_atom_feed(blogchain))
+            self.write_file(
+                os.path.join(OUTPUTDIR, feed_filename),
+                self.create_atom_feed(blogchain),
+            )
+
+        self.write_manifest(manifest)
+        self.sweep_render_cache(blogchain)
 
 
 if __name__ == "__main__":